@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Excel写入工具
+供PDF标题重命名、表格数据处理和论文机构报告三个脚本共用：
+用xlsxwriter逐行写入只有一个工作表的Excel文件，标题行字体加粗
+"""
+
+def write_xlsx(file_path, headers, rows, sheet_name=None, column_widths=None):
+    """将标题行和数据行写入Excel文件
+
+    rows为逐行产生数据的可迭代对象，每行是与headers对应的值序列；
+    column_widths为每列的宽度列表，为None时使用默认列宽
+    """
+    # 只在写入Excel时才导入xlsxwriter，导入各脚本本身不依赖xlsxwriter
+    import xlsxwriter
+
+    # 使用xlsxwriter的constant_memory模式逐行写入磁盘，内存中只保留当前行
+    # 文本按原样写入，不转换为公式或超链接
+    workbook_options = {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False
+    }
+    with xlsxwriter.Workbook(file_path, workbook_options) as workbook:
+        worksheet = workbook.add_worksheet(sheet_name)
+        bold_format = workbook.add_format({'bold': True})
+
+        # 应用列宽设置（需在写入数据之前完成）
+        if column_widths is not None:
+            for col_idx, width in enumerate(column_widths):
+                worksheet.set_column(col_idx, col_idx, width)
+
+        # 写入标题行（字体加粗）和数据行
+        worksheet.write_row(0, 0, headers, bold_format)
+        for row_idx, row in enumerate(rows, start=1):
+            worksheet.write_row(row_idx, 0, row)
@@ -9,36 +9,51 @@
 """
 
 import os
+import importlib.util
 import re
 import pandas as pd
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+from logging_utils import log_dir, configure as configure_logging
+from excel_utils import write_xlsx
 
-# 配置日志
-log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-os.makedirs(log_dir, exist_ok=True)
+try:
+    # 可选依赖：pyahocorasick，用于出版社关键词的单遍匹配
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 日志和报告都输出到log_dir目录，日志只在命令行入口配置，导入本模块时不会创建日志文件
+script_dir = os.path.dirname(os.path.abspath(__file__))
 
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 log_file = os.path.join(log_dir, f"paper_institution_report_{timestamp}.log")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger()
 
+# 文件名清理用的正则（模块加载时预编译）
+_RE_TRAIL_NUM = re.compile(r'[\-_]\d+$')  # 末尾序号，如 _1, -1
+_RE_TRAIL_CJK = re.compile(r'[_-][\u4e00-\u9fa5]+$')  # 末尾中文作者名
+_RE_TRAIL_YEAR = re.compile(r'[_-]\d{4}$')  # 末尾年份
+
+# 论文数据的列名（即报告中的三列），数据按列存放
+PAPER_COLUMNS = ["论文所属机构", "细分子机构", "论文标题"]
+
+# 扫描时在任意层级都跳过的文件夹（另外所有以.开头的隐藏文件夹也会跳过）
+_SKIP_DIRS = frozenset(['logs', '__pycache__', 'node_modules'])
+
 class PaperInstitutionReporter:
     """论文机构信息报告生成器"""
     
     def __init__(self):
         """初始化报告生成器"""
-        self.root_dir = os.path.dirname(os.path.abspath(__file__))
+        self.root_dir = script_dir
         self.output_excel = os.path.join(log_dir, f"论文机构信息汇总_{timestamp}.xlsx")
+        self.output_parquet = os.path.join(log_dir, f"论文机构信息汇总_{timestamp}.parquet")
         self.report_file = os.path.join(log_dir, f"机构分布报告_{timestamp}.txt")
+        os.makedirs(log_dir, exist_ok=True)
         
         # 主要机构文件夹映射
         self.institution_mapping = {
@@ -52,6 +67,9 @@ class PaperInstitutionReporter:
             "知网": "中国知网"
         }
         
+        # 小写机构名到机构的映射，供出版社识别的兜底逻辑使用
+        self._inst_mapping_lower = {k.lower(): v for k, v in self.institution_mapping.items()}
+        
         # 出版社识别关键词
         self.publisher_patterns = {
             "AAAI Press": ["AAAI"],
@@ -64,184 +82,230 @@ class PaperInstitutionReporter:
             "中国知网": ["知网", "CNKI"]
         }
         
-        # 数据存储
-        self.papers_data = []
+        # 机构名（小写）到出版社的精确匹配表，重复关键词以先出现的出版社为准
+        self._inst_to_publisher = {}
+        for publisher, keywords in self.publisher_patterns.items():
+            for keyword in keywords:
+                self._inst_to_publisher.setdefault(keyword.lower(), publisher)
+        
+        # 预先转小写的出版社关键词，供未安装pyahocorasick时的逐个匹配使用
+        self._pub_kws_lower = [(publisher, tuple(keyword.lower() for keyword in keywords))
+                               for publisher, keywords in self.publisher_patterns.items()]
+        
+        # 出版社关键词自动机，载荷为 (优先级, 出版社)，优先级沿用 publisher_patterns 的顺序
+        self._pub_ac = None
+        if ahocorasick is not None:
+            self._pub_ac = ahocorasick.Automaton()
+            for priority, (publisher, keywords) in enumerate(self.publisher_patterns.items()):
+                for keyword in keywords:
+                    if keyword.lower() not in self._pub_ac:
+                        self._pub_ac.add_word(keyword.lower(), (priority, publisher))
+            self._pub_ac.make_automaton()
+        
+        # 并行扫描机构文件夹的线程数
+        self.scan_workers = 8
+        
+        # 超过该行数时Excel报告不再自动计算列宽
+        self.auto_width_max_rows = 5000
+        
+        # 数据存储（按列存放，生成报告时可直接构建DataFrame）
+        self.papers_data = {column: [] for column in PAPER_COLUMNS}
+        self.report_df = None
         
         # 统计信息
         self.stats = {
             "total_papers": 0,
-            "institution_counts": {},
-            "publisher_counts": {}
+            "institution_counts": Counter(),
+            "publisher_counts": Counter()
         }
     
-    def sanitize_filename(self, filename):
-        """清理文件名，移除.pdf扩展名和可能的序号"""
-        # 移除.pdf扩展名
-        if filename.lower().endswith('.pdf'):
-            filename = filename[:-4]
-        
-        # 移除末尾的序号（如 _1, -1）
-        filename = re.sub(r'[\-_]\d+$', '', filename)
-        
-        return filename.strip()
-    
-    def identify_publisher(self, institution, filename):
-        """根据机构和文件名识别出版社"""
-        text_to_check = f"{institution} {filename}".lower()
-        
+    def identify_publisher(self, institution_lower, filename_lower):
+        """根据机构和文件名识别出版社（参数均为已转小写的文本）"""
         # 优先根据机构匹配出版社
-        for publisher, keywords in self.publisher_patterns.items():
-            for keyword in keywords:
-                if keyword.lower() == institution.lower():
-                    return publisher
+        publisher = self._inst_to_publisher.get(institution_lower)
+        if publisher:
+            return publisher
         
-        # 根据文件名内容匹配
-        for publisher, keywords in self.publisher_patterns.items():
-            for keyword in keywords:
-                if keyword.lower() in text_to_check:
+        # 根据机构名和文件名内容匹配
+        if self._pub_ac is not None:
+            # 单遍扫描找出全部命中，取优先级最高的出版社
+            hits = [payload for text in (institution_lower, filename_lower)
+                    for _, payload in self._pub_ac.iter(text)]
+            if hits:
+                return min(hits)[1]
+        else:
+            for publisher, keywords in self._pub_kws_lower:
+                if any(keyword in institution_lower or keyword in filename_lower for keyword in keywords):
                     return publisher
         
         # 如果无法识别，返回默认值
-        if institution in self.institution_mapping:
-            return self.institution_mapping[institution]
+        if institution_lower in self._inst_mapping_lower:
+            return self._inst_mapping_lower[institution_lower]
         
         return "未知出版社"
     
-    def extract_title_from_filename(self, filename):
-        """从文件名中提取论文标题"""
-        # 清理文件名
-        title = self.sanitize_filename(filename)
+    def identify_folder_publishers(self, original_folder, filenames):
+        """识别同一顶层机构文件夹下各PDF的出版社
+        
+        文件夹名能直接查到出版社时整个文件夹共用，否则才逐个调用 identify_publisher 匹配文件名
+        """
+        institution_lower = original_folder.lower()
+        folder_publisher = self._inst_to_publisher.get(institution_lower)
+        if folder_publisher:
+            return [folder_publisher] * len(filenames)
+        
+        return [self.identify_publisher(institution_lower, filename.lower()) for filename in filenames]
+    
+    def extract_titles(self, filenames):
+        """从文件名中批量提取论文标题（使用pandas字符串操作整列处理）"""
+        # 移除.pdf扩展名（扫描时只收集了.pdf文件）
+        titles = filenames.str[:-4]
+        
+        # 移除末尾的序号（如 _1, -1）
+        titles = titles.str.replace(_RE_TRAIL_NUM, '', regex=True).str.strip()
         
         # 尝试移除可能的作者信息（通常在文件名开头或末尾）
         # 如 "基于布隆过滤器的联邦遗忘学习_陈萍" -> "基于布隆过滤器的联邦遗忘学习"
-        title = re.sub(r'[_-][\u4e00-\u9fa5]+$', '', title)
+        titles = titles.str.replace(_RE_TRAIL_CJK, '', regex=True)
         
         # 尝试移除可能的年份信息
-        title = re.sub(r'[_-]\d{4}$', '', title)
+        titles = titles.str.replace(_RE_TRAIL_YEAR, '', regex=True)
         
-        return title.strip()
+        return titles.str.strip()
     
     def scan_directories(self):
         """扫描目录结构，提取论文信息"""
         logger.info(f"开始扫描目录: {self.root_dir}")
         
+        # 待扫描的机构文件夹，元素为 (文件夹路径, 机构名称, 顶层机构文件夹名)
+        institution_folders = []
+        
         # 遍历主要机构文件夹
-        for folder_name in os.listdir(self.root_dir):
-            folder_path = os.path.join(self.root_dir, folder_name)
-            
-            # 跳过非目录和系统文件夹
-            if not os.path.isdir(folder_path) or folder_name.startswith('.') or folder_name in ['logs']:
-                continue
-            
-            # 检查是否是已知机构
-            if folder_name not in self.institution_mapping:
-                logger.warning(f"未知机构文件夹: {folder_name}")
-                institution = folder_name
-            else:
-                institution = self.institution_mapping[folder_name]
-            
-            logger.info(f"处理机构: {institution} ({folder_name})")
+        with os.scandir(self.root_dir) as it:
+            for entry in it:
+                folder_name = entry.name
+                
+                # 跳过非目录和系统文件夹
+                if not entry.is_dir(follow_symlinks=False) or folder_name in _SKIP_DIRS or folder_name.startswith('.'):
+                    continue
+                
+                # 检查是否是已知机构
+                if folder_name not in self.institution_mapping:
+                    logger.warning(f"未知机构文件夹: {folder_name}")
+                    institution = folder_name
+                else:
+                    institution = self.institution_mapping[folder_name]
+                
+                logger.info(f"处理机构: {institution} ({folder_name})")
+                institution_folders.append((entry.path, institution, folder_name))
+        
+        # 扫描阶段只收集原始信息，出版社按文件夹识别，标题在扫描结束后整列处理
+        institutions = []
+        publishers = []
+        filenames = []
+        
+        # 目录遍历以系统调用为主（会释放GIL），各机构文件夹交给线程池并行扫描
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as executor:
+            futures = [executor.submit(self._scan_folder, *folder) for folder in institution_folders]
             
-            # 扫描该机构文件夹下的所有PDF文件
-            self._scan_folder(folder_path, institution, folder_name)
+            # 按提交顺序合并结果，保证报告中的论文顺序稳定
+            for (_, institution, folder_name), future in zip(institution_folders, futures):
+                folder_institutions, folder_filenames = future.result()
+                institutions.extend(folder_institutions)
+                publishers.extend(self.identify_folder_publishers(folder_name, folder_filenames))
+                filenames.extend(folder_filenames)
+                logger.info(f"机构 {institution} 扫描完成，发现 {len(folder_filenames)} 篇论文")
         
+        # 整列提取标题
+        self.papers_data = {
+            "论文所属机构": institutions,
+            "细分子机构": publishers,
+            "论文标题": self.extract_titles(pd.Series(filenames, dtype=object)).tolist()
+        }
+        
+        # 更新统计信息
+        self.stats["institution_counts"] = Counter(self.papers_data["论文所属机构"])
+        self.stats["publisher_counts"] = Counter(self.papers_data["细分子机构"])
+        self.stats["total_papers"] = len(filenames)
         logger.info(f"扫描完成，共发现 {self.stats['total_papers']} 篇论文")
     
     def _scan_folder(self, folder_path, institution, original_folder):
-        """递归扫描文件夹"""
-        try:
-            for item in os.listdir(folder_path):
-                item_path = os.path.join(folder_path, item)
-                
-                # 如果是子文件夹，递归处理
-                if os.path.isdir(item_path):
-                    # 子文件夹可能表示更细分的机构
-                    sub_institution = f"{institution} - {item}"
-                    logger.info(f"进入子文件夹: {item}")
-                    self._scan_folder(item_path, sub_institution, original_folder)
-                
-                # 处理PDF文件
-                elif item.lower().endswith('.pdf'):
-                    try:
-                        # 提取标题
-                        title = self.extract_title_from_filename(item)
-                        
-                        # 识别出版社
-                        publisher = self.identify_publisher(original_folder, item)
-                        
-                        # 保存数据
-                        self.papers_data.append({
-                            "论文所属机构": institution,
-                            "细分子机构": publisher,
-                            "论文标题": title,
-                            "原始文件名": item,
-                            "文件路径": folder_path
-                        })
-                        
-                        # 更新统计信息
-                        self.stats["total_papers"] += 1
-                        self.stats["institution_counts"][institution] = self.stats["institution_counts"].get(institution, 0) + 1
-                        self.stats["publisher_counts"][publisher] = self.stats["publisher_counts"].get(publisher, 0) + 1
-                        
-                        # 进度提示
-                        if self.stats["total_papers"] % 10 == 0:
-                            logger.info(f"已处理 {self.stats['total_papers']} 篇论文")
+        """扫描单个机构文件夹及其子文件夹
+        
+        不修改实例状态，便于在线程池中执行；返回 (各PDF所属机构列表, PDF文件名列表)
+        """
+        institutions = []
+        filenames = []
+        
+        # 以bytes路径遍历，文件名无需逐个解码，只有子文件夹和PDF文件才解码为str
+        # 待扫描的文件夹栈，元素为 (文件夹路径, 机构名称)
+        stack = deque([(os.fsencode(folder_path), institution)])
+        while stack:
+            folder_path, institution = stack.pop()
+            
+            try:
+                with os.scandir(folder_path) as it:
+                    for entry in it:
+                        # 子文件夹入栈稍后处理，系统和隐藏文件夹整棵跳过
+                        if entry.is_dir(follow_symlinks=False):
+                            item = os.fsdecode(entry.name)
+                            if item in _SKIP_DIRS or item.startswith('.'):
+                                continue
                             
-                    except Exception as e:
-                        logger.error(f"处理文件 {item} 时出错: {str(e)}")
+                            # 子文件夹可能表示更细分的机构
+                            sub_institution = f"{institution} - {item}"
+                            logger.debug(f"进入子文件夹: {item}")
+                            stack.append((entry.path, sub_institution))
                         
-        except Exception as e:
-            logger.error(f"扫描文件夹 {folder_path} 时出错: {str(e)}")
+                        # 记录PDF文件
+                        elif entry.name.lower().endswith(b'.pdf') and entry.is_file():
+                            institutions.append(institution)
+                            filenames.append(os.fsdecode(entry.name))
+                                
+            except Exception as e:
+                logger.error(f"扫描文件夹 {os.fsdecode(folder_path)} 时出错: {str(e)}")
+        
+        return institutions, filenames
+    
+    def get_report_df(self):
+        """获取报告DataFrame（只收集了报告需要的三列），首次调用时创建"""
+        if self.report_df is None:
+            self.report_df = pd.DataFrame(self.papers_data, columns=PAPER_COLUMNS)
+        return self.report_df
     
     def generate_excel_report(self):
         """生成Excel报告"""
-        if not self.papers_data:
+        if not self.papers_data["论文标题"]:
             logger.error("没有论文数据可生成报告")
             return False
         
         try:
-            # 创建DataFrame
-            df = pd.DataFrame(self.papers_data)
+            report_df = self.get_report_df()
             
-            # 只保留需要的三列
-            report_df = df[["论文所属机构", "细分子机构", "论文标题"]]
+            # 设置列宽
+            column_widths = {
+                '论文所属机构': 30,
+                '细分子机构': 30,
+                '论文标题': 60
+            }
             
-            # 保存为Excel文件
-            with pd.ExcelWriter(self.output_excel, engine='openpyxl') as writer:
-                report_df.to_excel(writer, index=False, sheet_name='论文机构信息')
-                
-                # 格式化工作表
-                worksheet = writer.sheets['论文机构信息']
-                
-                # 设置列宽
-                column_widths = {
-                    '论文所属机构': 30,
-                    '细分子机构': 30,
-                    '论文标题': 60
-                }
-                
-                # 应用列宽设置
-                for column in worksheet.columns:
-                    column_letter = column[0].column_letter
-                    column_name = column[0].value
-                    
-                    if column_name in column_widths:
-                        worksheet.column_dimensions[column_letter].width = column_widths[column_name]
-                    else:
-                        # 自动调整宽度
-                        max_length = 0
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = min(max_length + 2, 50)
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # 设置标题行字体加粗
-                for cell in worksheet[1]:  # 标题行
-                    cell.font = cell.font.copy(bold=True)
+            # 计算每列宽度：固定宽度优先，其余列按最长内容自动调整（由pandas整列计算）
+            widths = {}
+            for column_name in report_df.columns:
+                if column_name in column_widths:
+                    widths[column_name] = column_widths[column_name]
+                elif len(report_df) > self.auto_width_max_rows:
+                    # 数据量较大时直接使用最大宽度
+                    widths[column_name] = 50
+                else:
+                    max_length = report_df[column_name].astype(str).str.len().max()
+                    widths[column_name] = min(max(max_length, len(column_name)) + 2, 50)
+            
+            # 保存为Excel文件（逐行写入，pandas的to_excel按列输出单元格，无法逐行写入磁盘）
+            write_xlsx(self.output_excel, report_df.columns,
+                       report_df.itertuples(index=False, name=None),
+                       sheet_name='论文机构信息',
+                       column_widths=[widths[column_name] for column_name in report_df.columns])
             
             logger.info(f"Excel报告已生成: {self.output_excel}")
             return True
@@ -250,41 +314,69 @@ class PaperInstitutionReporter:
             logger.error(f"生成Excel报告失败: {str(e)}")
             return False
     
+    def generate_parquet_report(self):
+        """生成Parquet格式的报告（zstd压缩），写入和读取都远快于Excel，便于后续分析"""
+        if not self.papers_data["论文标题"]:
+            logger.error("没有论文数据可生成报告")
+            return False
+        
+        # 只查找pyarrow是否存在，不执行模块的导入
+        if importlib.util.find_spec('pyarrow') is None:
+            logger.warning("未安装pyarrow，跳过Parquet报告生成")
+            return False
+        
+        try:
+            self.get_report_df().to_parquet(self.output_parquet, engine='pyarrow', compression='zstd', index=False)
+            logger.info(f"Parquet报告已生成: {self.output_parquet}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"生成Parquet报告失败: {str(e)}")
+            return False
+    
     def generate_text_report(self):
         """生成文本格式的统计报告"""
         try:
+            # 先在内存中拼好整份报告，最后一次性写入文件
+            lines = []
+            lines.append("=" * 60 + "\n")
+            lines.append("论文机构分布统计报告\n")
+            lines.append("=" * 60 + "\n\n")
+            
+            lines.append(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
+            lines.append("1. 总体统计\n")
+            lines.append("-" * 40 + "\n")
+            lines.append(f"论文总数: {self.stats['total_papers']}\n")
+            lines.append(f"机构数量: {len(self.stats['institution_counts'])}\n")
+            lines.append(f"出版社数量: {len(self.stats['publisher_counts'])}\n\n")
+            
+            # 百分比换算系数只计算一次；没有论文时分布统计为空，不计算百分比
+            total_papers = self.stats['total_papers']
+            inv_total = 100.0 / total_papers if total_papers else 0.0
+            
+            lines.append("2. 机构分布统计\n")
+            lines.append("-" * 40 + "\n")
+            for institution, count in self.stats['institution_counts'].most_common():
+                lines.append(f"{institution}: {count} 篇 ({count * inv_total:.2f}%)\n")
+            lines.append("\n")
+            
+            lines.append("3. 出版社分布统计\n")
+            lines.append("-" * 40 + "\n")
+            for publisher, count in self.stats['publisher_counts'].most_common():
+                lines.append(f"{publisher}: {count} 篇 ({count * inv_total:.2f}%)\n")
+            lines.append("\n")
+            
+            lines.append("4. 输出文件信息\n")
+            lines.append("-" * 40 + "\n")
+            lines.append(f"Excel报告文件: {self.output_excel}\n")
+            if os.path.exists(self.output_parquet):
+                lines.append(f"Parquet报告文件: {self.output_parquet}\n")
+            lines.append(f"统计报告文件: {self.report_file}\n")
+            lines.append(f"日志文件: {log_file}\n")
+            
             with open(self.report_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 60 + "\n")
-                f.write("论文机构分布统计报告\n")
-                f.write("=" * 60 + "\n\n")
-                
-                f.write(f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                f.write("1. 总体统计\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"论文总数: {self.stats['total_papers']}\n")
-                f.write(f"机构数量: {len(self.stats['institution_counts'])}\n")
-                f.write(f"出版社数量: {len(self.stats['publisher_counts'])}\n\n")
-                
-                f.write("2. 机构分布统计\n")
-                f.write("-" * 40 + "\n")
-                for institution, count in sorted(self.stats['institution_counts'].items(), key=lambda x: x[1], reverse=True):
-                    percentage = count / self.stats['total_papers'] * 100
-                    f.write(f"{institution}: {count} 篇 ({percentage:.2f}%)\n")
-                f.write("\n")
-                
-                f.write("3. 出版社分布统计\n")
-                f.write("-" * 40 + "\n")
-                for publisher, count in sorted(self.stats['publisher_counts'].items(), key=lambda x: x[1], reverse=True):
-                    percentage = count / self.stats['total_papers'] * 100
-                    f.write(f"{publisher}: {count} 篇 ({percentage:.2f}%)\n")
-                f.write("\n")
-                
-                f.write("4. 输出文件信息\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Excel报告文件: {self.output_excel}\n")
-                f.write(f"统计报告文件: {self.report_file}\n")
-                f.write(f"日志文件: {log_file}\n")
+                f.write(''.join(lines))
             
             logger.info(f"统计报告已生成: {self.report_file}")
             return True
@@ -300,7 +392,7 @@ class PaperInstitutionReporter:
         # 步骤1: 扫描目录，提取论文信息
         self.scan_directories()
         
-        if not self.papers_data:
+        if not self.papers_data["论文标题"]:
             logger.error("没有找到论文文件，程序终止")
             return False
         
@@ -308,7 +400,11 @@ class PaperInstitutionReporter:
         if not self.generate_excel_report():
             logger.error("生成Excel报告失败")
         
-        # 步骤3: 生成统计报告
+        # 步骤3: 生成Parquet报告（可选，需要pyarrow）
+        if not self.generate_parquet_report():
+            logger.warning("未生成Parquet报告")
+        
+        # 步骤4: 生成统计报告
         if not self.generate_text_report():
             logger.error("生成统计报告失败")
         
@@ -321,15 +417,15 @@ class PaperInstitutionReporter:
 
 def main():
     """主函数"""
-    # 检查必要的依赖库
-    try:
-        import pandas as pd
-        import openpyxl
-    except ImportError:
+    # 检查必要的依赖库（只查找模块是否存在，不执行模块的导入）
+    # pandas在模块顶部导入，这里只检查写入Excel时才导入的xlsxwriter
+    if importlib.util.find_spec('xlsxwriter') is None:
         print("错误: 缺少必要的依赖库")
-        print("请运行: pip install pandas openpyxl")
+        print("请运行: pip install xlsxwriter")
         return 1
     
+    configure_logging(log_file)
+    
     # 创建报告生成器并运行
     reporter = PaperInstitutionReporter()
     success = reporter.run()
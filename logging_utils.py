@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+日志配置工具
+供PDF标题重命名、表格数据处理和论文机构报告三个脚本共用：
+日志同时输出到控制台和脚本所在目录下logs文件夹中的日志文件
+"""
+
+import os
+import logging
+import logging.handlers
+from pathlib import Path
+
+# 日志和各脚本输出文件所在的目录
+log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def configure(log_file):
+    """配置根日志，只在命令行入口调用，导入模块时不会创建日志目录和日志文件
+
+    根日志已经配置过处理器时（例如一个脚本在另一个脚本中被调用）不再重复配置
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    Path(log_file).parent.mkdir(exist_ok=True)
+
+    # 文件日志先缓存在内存中，累计1000条或出现错误时再批量写入磁盘
+    # 日志文件延迟到第一次写入时才创建
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    memory_handler = logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            memory_handler,
+            logging.StreamHandler()
+        ]
+    )
@@ -1,28 +1,33 @@
 import os
+import io
 import re
+import hashlib
+import json
 import logging
 from datetime import datetime
-import PyPDF2
 import pdfplumber
+from pdfminer.pdfdocument import PDFPasswordIncorrect
+from pdfminer.pdfparser import PDFSyntaxError
+from pdfminer.psparser import PSEOF
 import shutil
-from collections import defaultdict
-import pandas as pd
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import argparse
 import traceback
+from logging_utils import log_dir, configure as configure_logging
+from excel_utils import write_xlsx
+
+try:
+    # 可选依赖：pypdfium2，基于PDFium提取文本，速度远快于pdfplumber
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# 日志文件路径，日志和Excel报告都输出到log_dir目录
+# 日志只在命令行入口解析完参数后配置，导入本模块（包括进程池子进程）时不会创建日志目录和日志文件
+log_file = os.path.join(log_dir, f'pdf_renamer_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
 
-# 配置日志
-log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-os.makedirs(log_dir, exist_ok=True)
-log_file = os.path.join(log_dir, f'pdf_rename_log_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 # 配置参数
@@ -53,18 +58,15 @@ class Config:
         'university of', 'dept.', 'school of', 'college of'
     ]
     
+    # 标题提取结果缓存文件（保存在处理的根文件夹中）
+    RENAME_CACHE_FILE = '.pdf_rename_cache.json'
+    
     # 文件名格式配置
     DEFAULT_NAME_FORMAT = "未识别文件_{timestamp}"
     
     # 论文标准命名格式 - 仅包含标题格式
     PAPER_NAMING_FORMAT = "{title}"
     
-    # 年份模式（用于从文件名或文本中提取年份）
-    YEAR_PATTERNS = [
-        r'\b(19|20)\d{2}\b',  # 19xx或20xx格式的年份
-        r'\((19|20)\d{2}\)',  # (19xx)或(20xx)格式的年份
-    ]
-    
     # 作者模式（用于从文件名或文本中提取作者）
     AUTHOR_PATTERNS = [
         r'([A-Z][a-z]+)\s+et\s+al',  # 姓 et al 格式
@@ -84,23 +86,35 @@ class Config:
     ]
 
 
-# 全局变量初始化
-log_dir = None
-log_file = None
-logger = None
+# 非法字符转换表（str.maketrans 支持替换为多个字符，如 ':' -> ' -'）
+_ILLEGAL_TABLE = str.maketrans(Config.ILLEGAL_CHARS)
+
+# 预编译正则表达式，避免每次调用时重复查找正则缓存
+_WS_RE = re.compile(r'\s+')
+_DOT_RE = re.compile(r'\s*\.\s*')
+_NON_TITLE_RE = re.compile(r'\d{4}|vol\.|no\.|pp\.|et al|DOI|http|www|@|email|abstract|introduction', re.IGNORECASE)
+_TITLE_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in Config.TITLE_KEYWORDS), re.IGNORECASE)
+_INSTITUTION_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in Config.INSTITUTION_KEYWORDS), re.IGNORECASE)
+# 需要检查的页码（pdfplumber页码从1开始）
+_PAGES_TO_CHECK = list(range(1, Config.MAX_PAGES_TO_CHECK + 1))
+# 标题候选行的最高得分（长度2 + 单词数2 + 大写比例1 + 关键词3）
+_MAX_TITLE_SCORE = 8
+# 19xx或20xx格式的年份（也覆盖(19xx)、(20xx)等带括号的写法）；非捕获分组使findall返回完整的四位年份
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_AUTHOR_RES = [re.compile(pattern, re.IGNORECASE) for pattern in Config.AUTHOR_PATTERNS]
+_SKIP_RES = [re.compile(pattern) for pattern in Config.SKIP_PATTERNS]
 
 def sanitize_filename(filename):
     """清理文件名中的非法字符"""
     if not filename:
         return "未命名"
     
-    # 替换非法字符
-    for char, replacement in Config.ILLEGAL_CHARS.items():
-        filename = filename.replace(char, replacement)
+    # 一次扫描替换所有非法字符
+    filename = filename.translate(_ILLEGAL_TABLE)
     
     # 移除多余的空格和点号
-    filename = re.sub(r'\s+', ' ', filename).strip()
-    filename = re.sub(r'\s*\.\s*', '.', filename)
+    filename = _WS_RE.sub(' ', filename).strip()
+    filename = _DOT_RE.sub('.', filename)
     
     # 限制文件名长度
     if len(filename) > Config.MAX_TITLE_LENGTH:
@@ -117,13 +131,9 @@ def validate_title(title):
     if not title or len(title.strip()) < 5:
         return False
     
-    # 转换为小写进行关键词匹配
-    title_lower = title.lower()
-    
-    # 检查是否包含常见的标题关键词
-    for keyword in Config.TITLE_KEYWORDS:
-        if keyword.lower() in title_lower:
-            return True
+    # 检查是否包含常见的标题关键词（忽略大小写）
+    if _TITLE_KEYWORD_RE.search(title):
+        return True
     
     # 如果标题长度适中且包含多个单词，也可能是有效标题
     words = title.split()
@@ -132,147 +142,204 @@ def validate_title(title):
     
     return False
 
+@lru_cache(maxsize=256)
 def extract_institution(text):
-    """从文本中提取机构信息"""
+    """从文本中提取机构信息（结果缓存，同一批次中相同的文本只扫描一次）"""
     if not text:
         return None
     
-    text_lower = text.lower()
-    
-    # 查找包含机构关键词的行
-    lines = text.split('\n')
-    for line in lines:
-        line_lower = line.lower().strip()
-        for keyword in Config.INSTITUTION_KEYWORDS:
-            if keyword.lower() in line_lower:
-                # 提取可能的机构名称（通常是包含关键词的整个行）
-                return line.strip()[:100]  # 限制长度
+    # 对整段文本只扫描一次，最靠前的关键词所在的行即第一个包含机构关键词的行
+    match = _INSTITUTION_KEYWORD_RE.search(text)
+    if not match:
+        return None
     
-    return None
+    # 提取可能的机构名称（通常是包含关键词的整个行）
+    line_start = text.rfind('\n', 0, match.start()) + 1
+    line_end = text.find('\n', match.end())
+    if line_end == -1:
+        line_end = len(text)
+    return text[line_start:line_end].strip()[:100]  # 限制长度
 
-def extract_title_from_metadata(pdf_path):
-    """从PDF元数据中提取标题"""
-    try:
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            
-            # 检查PDF是否加密
-            if reader.is_encrypted:
-                try:
-                    # 尝试空密码解密
-                    reader.decrypt('')
-                    logger.info(f"PDF已加密，但成功使用空密码解密: {pdf_path}")
-                except:
-                    logger.warning(f"无法解密加密的PDF文件: {pdf_path}")
-                    return None, "encrypted"
-            
-            if reader.metadata:
-                # 尝试从不同的元数据字段获取标题
-                title_fields = ['/Title', '/Subject', '/Topic', '/Keywords']
-                for field in title_fields:
-                    title = reader.metadata.get(field, '')
-                    if title and title.strip() and title.strip().lower() not in ['', 'untitled', 'unnamed', 'no title']:
-                        cleaned_title = title.strip()
-                        # 使用关键词验证标题
-                        if validate_title(cleaned_title) or field == '/Title':
-                            return cleaned_title, None
-    except PyPDF2.errors.PdfReadError as e:
-        logger.error(f"PDF文件可能已损坏: {pdf_path} - {str(e)}")
-        return None, "corrupted"
-    except Exception as e:
-        logger.warning(f"从元数据提取标题失败 {pdf_path}: {str(e)}")
-        return None, str(e)
-    return None, None
+def extract_title_from_metadata(pdf):
+    """从已打开的PDF的元数据中提取标题"""
+    metadata = pdf.metadata
+    if metadata:
+        # 尝试从不同的元数据字段获取标题
+        title_fields = ['Title', 'Subject', 'Topic', 'Keywords']
+        for field in title_fields:
+            title = metadata.get(field, '')
+            # 元数据值也可能是未解码的bytes等非字符串对象，直接跳过
+            if not isinstance(title, str):
+                continue
+            if title and title.strip() and title.strip().lower() not in ['', 'untitled', 'unnamed', 'no title']:
+                cleaned_title = title.strip()
+                # 使用关键词验证标题
+                if validate_title(cleaned_title) or field == 'Title':
+                    return cleaned_title
+    return None
 
-def extract_title_from_content(pdf_path):
-    """从PDF内容中提取标题，使用多区域识别算法"""
+def _read_region_texts_pdfium(pdf_data, pdf_path):
+    """使用PDFium从内存中的PDF数据读取前几页的文本，按区域提取
+    
+    未安装pypdfium2、提取失败或没有文本层时返回None，由调用方回退到pdfplumber
+    """
+    if pdfium is None:
+        return None
+    
+    # 存储不同区域提取的文本，每页一项，最后以换行拼接，避免循环中反复拼接字符串
+    region_texts = {
+        'full': [],
+        'header': [],
+        'content': [],
+        'footer': []
+    }
+    regions = (
+        ('header', Config.HEADER_REGION),
+        ('content', Config.CONTENT_REGION),
+        ('footer', Config.FOOTER_REGION)
+    )
+    
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            # 存储不同区域提取的文本
-            region_texts = {
-                'full': '',
-                'header': '',
-                'content': '',
-                'footer': ''
-            }
-            
-            # 读取前几页的文本，按区域提取
-            num_pages = min(Config.MAX_PAGES_TO_CHECK, len(pdf.pages))
+        pdf = pdfium.PdfDocument(pdf_data)
+        try:
+            num_pages = min(Config.MAX_PAGES_TO_CHECK, len(pdf))
             for i in range(num_pages):
-                page = pdf.pages[i]
-                page_height = page.height
-                page_width = page.width
+                page = pdf[i]
+                page_width, page_height = page.get_size()
+                textpage = page.get_textpage()
                 
                 # 提取完整页面文本
-                full_text = page.extract_text() or ''
-                region_texts['full'] += full_text
-                
-                # 提取页眉区域文本
-                header_box = (
-                    page_width * Config.HEADER_REGION[0],
-                    page_height * Config.HEADER_REGION[1],
-                    page_width * Config.HEADER_REGION[2],
-                    page_height * Config.HEADER_REGION[3]
-                )
-                header_page = page.within_bbox(header_box)
-                region_texts['header'] += header_page.extract_text() or ''
-                
-                # 提取正文区域文本（最可能包含标题）
-                content_box = (
-                    page_width * Config.CONTENT_REGION[0],
-                    page_height * Config.CONTENT_REGION[1],
-                    page_width * Config.CONTENT_REGION[2],
-                    page_height * Config.CONTENT_REGION[3]
-                )
-                content_page = page.within_bbox(content_box)
-                region_texts['content'] += content_page.extract_text() or ''
+                region_texts['full'].append(textpage.get_text_range())
                 
-                # 提取页脚区域文本
-                footer_box = (
-                    page_width * Config.FOOTER_REGION[0],
-                    page_height * Config.FOOTER_REGION[1],
-                    page_width * Config.FOOTER_REGION[2],
-                    page_height * Config.FOOTER_REGION[3]
-                )
-                footer_page = page.within_bbox(footer_box)
-                region_texts['footer'] += footer_page.extract_text() or ''
-            
-            # 首先尝试从正文区域提取标题（最可能包含真实标题）
-            title = extract_title_from_text(region_texts['content'], 'content')
-            if title and validate_title(title):
-                return title, None, extract_institution(region_texts['full'])
-            
-            # 如果正文区域没有找到有效标题，尝试从完整页面提取
-            title = extract_title_from_text(region_texts['full'], 'full')
-            if title and validate_title(title):
-                return title, None, extract_institution(region_texts['full'])
-            
-            # 如果仍然没有找到，尝试从页眉区域（学术论文标题有时在页眉）
-            title = extract_title_from_text(region_texts['header'], 'header')
-            if title and validate_title(title):
-                return title, None, extract_institution(region_texts['full'])
-            
-            # 最后尝试从页脚区域
-            title = extract_title_from_text(region_texts['footer'], 'footer')
-            if title and validate_title(title):
-                return title, None, extract_institution(region_texts['full'])
-                
-            # 如果所有区域都没找到，尝试返回任何有意义的文本
-            all_lines = []
-            for region_text in region_texts.values():
-                if region_text:
-                    lines = region_text.split('\n')
-                    meaningful_lines = [line.strip() for line in lines 
-                                      if line.strip() and len(line.strip()) > 5]
-                    all_lines.extend(meaningful_lines)
-            
-            if all_lines:
-                # 选择最长的非数字行作为最后的尝试
-                candidate_lines = [line for line in all_lines[:10] if not line.isdigit()]
-                if candidate_lines:
-                    return max(candidate_lines, key=len), "low_confidence", extract_institution(region_texts['full'])
+                # 区域配置以页面左上角为原点，PDFium以左下角为原点，需要翻转纵坐标
+                for name, region in regions:
+                    region_texts[name].append(textpage.get_text_bounded(
+                        left=page_width * region[0],
+                        bottom=page_height * (1 - region[3]),
+                        right=page_width * region[2],
+                        top=page_height * (1 - region[1])
+                    ))
+        finally:
+            pdf.close()
+    except Exception as e:
+        logger.debug(f"PDFium提取文本失败，改用pdfplumber: {pdf_path} - {str(e)}")
+        return None
+    
+    # 页与页之间以换行分隔；PDFium以\r\n分隔行，统一为\n
+    region_texts = {name: '\n'.join(texts).replace('\r\n', '\n') for name, texts in region_texts.items()}
+    
+    # 没有文本层（如扫描件）时交给pdfplumber再试一次
+    if not region_texts['full'].strip():
+        return None
+    
+    return region_texts
+
+def _read_region_texts_pdfplumber(pdf):
+    """使用pdfplumber读取已打开PDF前几页的文本，按区域提取"""
+    # 存储不同区域提取的文本，每页一项，最后以换行拼接，避免循环中反复拼接字符串
+    region_texts = {
+        'full': [],
+        'header': [],
+        'content': [],
+        'footer': []
+    }
     
-    except pdfplumber.openers.PDFSyntaxError as e:
+    # 读取前几页的文本，按区域提取
+    num_pages = min(Config.MAX_PAGES_TO_CHECK, len(pdf.pages))
+    for i in range(num_pages):
+        page = pdf.pages[i]
+        page_height = page.height
+        page_width = page.width
+        
+        # 页面字符只解析一次，各区域直接从字符列表中按坐标筛选，不再为每个区域创建裁剪页面
+        chars = page.chars
+        
+        # 提取完整页面文本
+        region_texts['full'].append(page.extract_text() or '')
+        
+        # 提取页眉区域文本
+        header_box = (
+            page_width * Config.HEADER_REGION[0],
+            page_height * Config.HEADER_REGION[1],
+            page_width * Config.HEADER_REGION[2],
+            page_height * Config.HEADER_REGION[3]
+        )
+        header_chars = pdfplumber.utils.within_bbox(chars, header_box)
+        region_texts['header'].append(pdfplumber.utils.extract_text(header_chars) or '')
+        
+        # 提取正文区域文本（最可能包含标题）
+        content_box = (
+            page_width * Config.CONTENT_REGION[0],
+            page_height * Config.CONTENT_REGION[1],
+            page_width * Config.CONTENT_REGION[2],
+            page_height * Config.CONTENT_REGION[3]
+        )
+        content_chars = pdfplumber.utils.within_bbox(chars, content_box)
+        region_texts['content'].append(pdfplumber.utils.extract_text(content_chars) or '')
+        
+        # 提取页脚区域文本
+        footer_box = (
+            page_width * Config.FOOTER_REGION[0],
+            page_height * Config.FOOTER_REGION[1],
+            page_width * Config.FOOTER_REGION[2],
+            page_height * Config.FOOTER_REGION[3]
+        )
+        footer_chars = pdfplumber.utils.within_bbox(chars, footer_box)
+        region_texts['footer'].append(pdfplumber.utils.extract_text(footer_chars) or '')
+    
+    # 页与页之间以换行分隔，避免上一页末行与下一页首行粘连
+    return {name: '\n'.join(texts) for name, texts in region_texts.items()}
+
+def extract_title_from_content(pdf, pdf_path, pdf_data):
+    """从已打开的PDF内容中提取标题，使用多区域识别算法
+    
+    pdf_data 为已读入内存的PDF文件内容，供PDFium直接解析
+    """
+    try:
+        # 优先使用PDFium提取文本，不可用时使用pdfplumber
+        region_texts = _read_region_texts_pdfium(pdf_data, pdf_path)
+        if region_texts is None:
+            region_texts = _read_region_texts_pdfplumber(pdf)
+        
+        # 各返回路径使用的机构信息都来自完整页面文本，只提取一次
+        institution = extract_institution(region_texts['full'])
+        
+        # 首先尝试从正文区域提取标题（最可能包含真实标题）
+        title = extract_title_from_text(region_texts['content'], 'content')
+        if title and validate_title(title):
+            return title, None, institution
+        
+        # 如果正文区域没有找到有效标题，尝试从完整页面提取
+        title = extract_title_from_text(region_texts['full'], 'full')
+        if title and validate_title(title):
+            return title, None, institution
+        
+        # 如果仍然没有找到，尝试从页眉区域（学术论文标题有时在页眉）
+        title = extract_title_from_text(region_texts['header'], 'header')
+        if title and validate_title(title):
+            return title, None, institution
+        
+        # 最后尝试从页脚区域
+        title = extract_title_from_text(region_texts['footer'], 'footer')
+        if title and validate_title(title):
+            return title, None, institution
+            
+        # 如果所有区域都没找到，尝试返回任何有意义的文本
+        all_lines = []
+        for region_text in region_texts.values():
+            if region_text:
+                lines = region_text.split('\n')
+                meaningful_lines = [line.strip() for line in lines 
+                                  if line.strip() and len(line.strip()) > 5]
+                all_lines.extend(meaningful_lines)
+        
+        if all_lines:
+            # 选择最长的非数字行作为最后的尝试
+            candidate_lines = [line for line in all_lines[:10] if not line.isdigit()]
+            if candidate_lines:
+                return max(candidate_lines, key=len), "low_confidence", institution
+
+    except PDFSyntaxError as e:
         logger.error(f"PDF语法错误，文件可能已损坏: {pdf_path} - {str(e)}")
         return None, "corrupted", None
     except Exception as e:
@@ -286,52 +353,61 @@ def extract_title_from_text(text, region_name=""):
     if not text:
         return None
     
-    # 分割文本为行
-    lines = text.split('\n')
-    
-    # 过滤空行和很短的行
-    meaningful_lines = [line.strip() for line in lines 
-                      if line.strip() and len(line.strip()) > 3]
-    
-    if not meaningful_lines:
-        return None
-    
     # 策略1：查找可能的标题（通常在文档开头，较长，包含多个单词）
-    candidate_titles = []
-    for i, line in enumerate(meaningful_lines[:10]):  # 检查前10行
-        # 跳过明显不是标题的行
-        if re.search(r'\d{4}|vol\.|no\.|pp\.|et al|DOI|http|www|@|email|abstract|introduction', 
-                    line, re.IGNORECASE):
+    # 逐行过滤并打分，只保留得分最高的候选（同分时取靠前的行），不再排序
+    # 循环中反复用到的函数和正则方法先绑定到局部变量，行长度和单词数每行只计算一次
+    meaningful_lines = []
+    add_meaningful_line = meaningful_lines.append
+    is_non_title = _NON_TITLE_RE.search
+    has_title_keyword = _TITLE_KEYWORD_RE.search
+    isupper = str.isupper
+    best_title = None
+    best_score = -1
+    for line in text.split('\n'):
+        line = line.strip()
+        line_length = len(line)
+        
+        # 过滤空行和很短的行
+        if line_length <= 3:
             continue
+        add_meaningful_line(line)
         
-        # 检查是否可能是标题
-        words = line.split()
-        if len(words) >= 3 and len(line) > 10:
+        # 跳过明显不是标题的行，检查其余行是否可能是标题
+        word_count = len(line.split()) if line_length > 10 else 0
+        if word_count >= 3 and not is_non_title(line):
             # 计算标题得分
             score = 0
             # 长度得分
-            if 15 < len(line) < 200:
+            if 15 < line_length < 200:
                 score += 2
             # 单词数量得分
-            if 4 < len(words) < 30:
+            if 4 < word_count < 30:
                 score += 2
             # 大写字母比例得分（标题通常大写比例较高）
-            uppercase_ratio = sum(1 for c in line if c.isupper()) / max(len(line), 1)
+            uppercase_ratio = sum(map(isupper, line)) / line_length
             if 0.2 < uppercase_ratio < 0.8:
                 score += 1
             # 关键词匹配得分
-            for keyword in Config.TITLE_KEYWORDS:
-                if keyword.lower() in line.lower():
-                    score += 3
-                    break
+            if has_title_keyword(line):
+                score += 3
             
-            candidate_titles.append((line, score))
+            # 已达到最高分，后面的行不可能更好
+            if score >= _MAX_TITLE_SCORE:
+                return line
+            if score > best_score:
+                best_title = line
+                best_score = score
+        
+        # 只检查前10行有意义的文本
+        if len(meaningful_lines) >= 10:
+            break
+    
+    if not meaningful_lines:
+        return None
     
     # 如果找到候选标题，返回得分最高的
-    if candidate_titles:
-        # 按得分排序
-        candidate_titles.sort(key=lambda x: x[1], reverse=True)
-        return candidate_titles[0][0]
+    if best_title is not None:
+        return best_title
     
     # 策略2：如果没有找到候选标题，尝试返回第一行较长的文本
     for line in meaningful_lines[:5]:
@@ -342,34 +418,47 @@ def extract_title_from_text(text, region_name=""):
     return meaningful_lines[0] if meaningful_lines else None
 
 def extract_title(pdf_path):
-    """综合多种方法提取PDF标题，返回标题、状态和机构信息"""
-    # 首先尝试从元数据提取
-    metadata_title, metadata_status = extract_title_from_metadata(pdf_path)
-    
-    # 处理特殊状态
-    if metadata_status == "encrypted":
-        logger.warning(f"PDF文件已加密，无法提取标题: {pdf_path}")
-        return None, "encrypted", None
-    elif metadata_status == "corrupted":
-        logger.error(f"PDF文件可能已损坏，无法提取标题: {pdf_path}")
-        return None, "corrupted", None
+    """综合多种方法提取PDF标题，返回标题、状态和机构信息
     
-    # 如果元数据提取成功
-    if metadata_title:
-        logger.info(f"从元数据成功提取标题: {metadata_title}")
-        # 再次尝试提取机构信息（元数据函数不返回机构信息）
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                if pdf.pages:
-                    page_text = pdf.pages[0].extract_text() or ''
-                    institution = extract_institution(page_text)
-                    return metadata_title, "metadata", institution
-        except:
-            pass
-        return metadata_title, "metadata", None
-    
-    # 如果元数据提取失败，尝试从内容提取
-    content_title, content_status, institution = extract_title_from_content(pdf_path)
+    PDF只打开解析一次，元数据和页面内容都从同一个文档对象读取
+    """
+    try:
+        # 一次顺序读入整个文件，之后pdfplumber和PDFium都在内存中解析，
+        # 避免解析过程中对磁盘的大量小块随机读取，也不必为PDFium再次打开文件
+        with open(pdf_path, 'rb') as file:
+            pdf_data = file.read()
+        
+        # 只为需要检查的前几页创建页面对象；不传入laparams，避免触发pdfminer的版面分析
+        with pdfplumber.open(io.BytesIO(pdf_data), pages=_PAGES_TO_CHECK) as pdf:
+            # 首先尝试从元数据提取
+            metadata_title = extract_title_from_metadata(pdf)
+            
+            # 如果元数据提取成功
+            if metadata_title:
+                logger.info(f"从元数据成功提取标题: {metadata_title}")
+                # 元数据不含机构信息，从已打开文档的首页文本中提取
+                institution = None
+                try:
+                    if pdf.pages:
+                        page_text = pdf.pages[0].extract_text() or ''
+                        institution = extract_institution(page_text)
+                except:
+                    pass
+                return metadata_title, "metadata", institution
+            
+            # 如果元数据提取失败，尝试从内容提取
+            content_title, content_status, institution = extract_title_from_content(pdf, pdf_path, pdf_data)
+    except Exception as e:
+        # 新版pdfplumber会把pdfminer的异常包装为PdfminerException，取出原始异常判断类型
+        cause = e.args[0] if e.args and isinstance(e.args[0], Exception) else e
+        if isinstance(cause, PDFPasswordIncorrect):
+            logger.warning(f"PDF文件已加密，无法提取标题: {pdf_path}")
+            return None, "encrypted", None
+        elif isinstance(cause, (PDFSyntaxError, PSEOF)):
+            logger.error(f"PDF文件可能已损坏，无法提取标题: {pdf_path} - {str(cause)}")
+            return None, "corrupted", None
+        logger.warning(f"打开PDF文件失败 {pdf_path}: {str(e)}")
+        return None, "extraction_failed", None
     
     if content_title:
         if content_status == "low_confidence":
@@ -386,16 +475,11 @@ def extract_year(text):
     if not text:
         return None
     
-    # 遍历所有年份模式
-    for pattern in Config.YEAR_PATTERNS:
-        matches = re.findall(pattern, text)
-        if matches:
-            # 提取完整的年份数字
-            full_matches = re.findall(r'\b(19|20)\d{2}\b', text)
-            if full_matches:
-                # 选择最近的年份（如果有多个）
-                years = sorted([int(match) for match in full_matches], reverse=True)
-                return str(years[0])
+    # 对文本只扫描一次，选择最近的年份（如果有多个）
+    # 四位年份字符串按字典序比较与按数值比较结果一致
+    years = _YEAR_RE.findall(text)
+    if years:
+        return max(years)
     
     # 如果没有找到，尝试从当前日期获取年份作为默认值
     return datetime.now().strftime("%Y")
@@ -406,8 +490,8 @@ def extract_author(text):
         return "Unknown"
     
     # 遍历所有作者模式
-    for pattern in Config.AUTHOR_PATTERNS:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _AUTHOR_RES:
+        matches = pattern.search(text)
         if matches:
             author = matches.group(1).strip()
             # 如果是多个作者，只取第一个
@@ -485,7 +569,177 @@ def generate_default_filename(timestamp=None):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     return Config.DEFAULT_NAME_FORMAT.format(timestamp=timestamp) + '.pdf'
 
-def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_excel=True):
+def _scan_entries(directory):
+    """列出目录中的全部条目，出错时记录日志并返回空列表"""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except Exception as e:
+        logger.error(f"处理目录时发生错误 {directory}: {str(e)}")
+        logger.debug(traceback.format_exc())
+        return []
+
+def walk_pdfs(root_folder, recursive, stats):
+    """遍历文件夹，按顺序生成待处理的PDF文件路径
+    
+    跳过的文件会记录日志，文件数量累计到 stats 中
+    """
+    # 用显式的栈代替递归，避免目录层级过深时超出递归深度限制
+    # 栈中保存各层目录尚未遍历完的条目，处理顺序与递归遍历相同
+    stack = deque([iter(_scan_entries(root_folder))])
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        
+        item = entry.name
+        item_path = entry.path
+        
+        # 根文件夹中的缓存文件不属于待处理文件
+        if len(stack) == 1 and item == Config.RENAME_CACHE_FILE:
+            continue
+        
+        # 如果是子文件夹且需要递归处理（不跟随符号链接，避免循环）
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                stack.append(iter(_scan_entries(item_path)))
+            continue
+        
+        # 跳过非文件项
+        if not entry.is_file():
+            continue
+        
+        stats['total_files'] += 1
+        
+        # 检查是否需要跳过（基于模式）
+        skip = False
+        for pattern in _SKIP_RES:
+            if pattern.match(item):
+                logger.info(f"跳过匹配模式的文件: {item_path}")
+                stats['skipped_files'] += 1
+                skip = True
+                break
+        
+        if skip:
+            continue
+        
+        # 只处理PDF文件
+        if not item.lower().endswith('.pdf'):
+            logger.info(f"跳过非PDF文件: {item_path}")
+            stats['skipped_files'] += 1
+            continue
+        
+        stats['pdf_files'] += 1
+        yield item_path
+
+def _file_digest(path):
+    """计算文件内容的SHA-256摘要"""
+    with open(path, 'rb') as file:
+        # Python 3.11+ 的 hashlib.file_digest 在C层分块读取并计算
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(file, 'sha256').digest()
+        
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+def find_duplicate_pdfs(pdf_paths):
+    """查找内容完全相同的PDF文件
+    
+    返回 {重复文件路径: 第一个内容相同的文件路径}。
+    先按文件大小分组，只有大小相同的文件才需要读取内容计算哈希。
+    """
+    paths_by_size = defaultdict(list)
+    for path in pdf_paths:
+        try:
+            paths_by_size[os.path.getsize(path)].append(path)
+        except OSError:
+            continue
+    
+    duplicates = {}
+    for same_size_paths in paths_by_size.values():
+        if len(same_size_paths) < 2:
+            continue
+        
+        first_by_digest = {}
+        for path in same_size_paths:
+            try:
+                digest = _file_digest(path)
+            except OSError as e:
+                logger.warning(f"计算文件哈希失败 {path}: {str(e)}")
+                continue
+            first_path = first_by_digest.setdefault(digest, path)
+            if first_path != path:
+                duplicates[path] = first_path
+    
+    return duplicates
+
+def load_rename_cache(cache_path):
+    """读取上次运行保存的标题提取结果缓存，文件不存在或格式错误时返回空字典"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"读取缓存文件失败，将重新解析全部文件: {cache_path} - {str(e)}")
+        return {}
+    
+    return cache if isinstance(cache, dict) else {}
+
+def save_rename_cache(cache_path, cache):
+    """保存标题提取结果缓存（先写入临时文件再替换，避免中断时留下损坏的缓存）"""
+    temp_path = cache_path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"保存缓存文件失败: {cache_path} - {str(e)}")
+
+class _LogRecordCollector(logging.Handler):
+    """在子进程中收集日志记录，随处理结果一起返回主进程输出"""
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        # 先格式化消息，保证日志记录可以序列化传回主进程
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+_worker_log_collector = None
+
+def _init_worker(log_level):
+    """进程池初始化函数：子进程不直接写日志，而是收集后交给主进程统一输出"""
+    global logger, _worker_log_collector
+    _worker_log_collector = _LogRecordCollector()
+    logger = logging.getLogger('pdf_title_renamer.worker')
+    logger.handlers = [_worker_log_collector]
+    logger.propagate = False
+    logger.setLevel(log_level)
+
+def extract_title_worker(pdf_path):
+    """在子进程中提取单个PDF的标题信息
+    
+    返回 (标题, 状态, 机构信息, 错误信息, 日志记录列表)
+    """
+    _worker_log_collector.records = []
+    title = status = institution = error_message = None
+    
+    try:
+        # 提取标题、状态和机构信息
+        title, status, institution = extract_title(pdf_path)
+    except Exception as e:
+        error_message = f"处理过程异常: {str(e)}"
+    
+    return title, status, institution, error_message, _worker_log_collector.records
+
+def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_excel=True, use_cache=True):
     """重命名文件夹中的所有PDF文件
     
     Args:
@@ -493,6 +747,7 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
         recursive: 是否递归处理子文件夹
         custom_unknown_name: 用户自定义的未知文件命名前缀
         generate_excel: 是否生成Excel汇总表
+        use_cache: 是否使用标题提取结果缓存，跳过上次运行后未变化的文件
     """
     # 检查文件夹是否存在
     if not os.path.exists(root_folder):
@@ -516,51 +771,73 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
     # 用于存储Excel数据
     excel_data = []
     
-    # 递归遍历函数
-    def process_directory(directory):
-        # 跟踪当前目录中的文件信息
-        dir_files = []
-        
-        # 遍历当前目录
-        try:
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                
-                # 如果是子文件夹且需要递归处理
-                if os.path.isdir(item_path) and recursive:
-                    process_directory(item_path)
-                    continue
-                
-                # 跳过非文件项
-                if not os.path.isfile(item_path):
-                    continue
-                
-                stats['total_files'] += 1
-                
-                # 检查是否需要跳过（基于模式）
-                skip = False
-                for pattern in Config.SKIP_PATTERNS:
-                    if re.match(pattern, item):
-                        logger.info(f"跳过匹配模式的文件: {item_path}")
-                        stats['skipped_files'] += 1
-                        skip = True
-                        break
-                
-                if skip:
-                    continue
-                
-                # 只处理PDF文件
-                if not item.lower().endswith('.pdf'):
-                    logger.info(f"跳过非PDF文件: {item_path}")
-                    stats['skipped_files'] += 1
-                    continue
-                
-                stats['pdf_files'] += 1
+    # 开始处理
+    logger.info(f"开始处理文件夹: {root_folder}")
+    if recursive:
+        logger.info("将递归处理所有子文件夹")
+    
+    # 先收集全部待处理的PDF文件，再交给进程池并行提取标题
+    pdf_paths = list(walk_pdfs(root_folder, recursive, stats))
+    
+    # 缓存以相对路径为键，记录文件大小、修改时间和提取结果；两者都未变化的文件直接使用缓存结果
+    cache_path = os.path.join(root_folder, Config.RENAME_CACHE_FILE)
+    cached_results = load_rename_cache(cache_path) if use_cache else {}
+    new_cache = {}
+    file_signatures = {}
+    cache_hits = {}
+    if use_cache:
+        for path in pdf_paths:
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                continue
+            file_signatures[path] = (file_stat.st_size, file_stat.st_mtime_ns)
+            
+            entry = cached_results.get(os.path.relpath(path, root_folder))
+            if (isinstance(entry, dict) and entry.get('size') == file_stat.st_size
+                    and entry.get('mtime_ns') == file_stat.st_mtime_ns):
+                cache_hits[path] = (entry.get('title'), entry.get('status'), entry.get('institution'))
+    
+    # 内容完全相同的PDF只解析第一个，其余复用它的提取结果
+    uncached_paths = [path for path in pdf_paths if path not in cache_hits]
+    duplicate_sources = find_duplicate_pdfs(uncached_paths)
+    shared_paths = set(duplicate_sources.values())
+    parse_paths = [path for path in uncached_paths if path not in duplicate_sources]
+    
+    if pdf_paths:
+        # PDF解析是CPU密集型任务，使用多进程避开GIL；重命名和重复标题计数仍在主进程中按顺序执行
+        # 全部命中缓存时不会提交任务，也就不会启动子进程
+        max_workers = max(1, min(os.cpu_count() or 1, len(parse_paths)))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(logger.getEffectiveLevel(),)) as executor:
+            results = executor.map(extract_title_worker, parse_paths, chunksize=4)
+            shared_results = {}
+            for item_path in pdf_paths:
+                directory, item = os.path.split(item_path)
                 logger.info(f"处理文件: {item_path}")
                 
-                # 记录处理开始时间
+                source_path = duplicate_sources.get(item_path)
+                if item_path in cache_hits:
+                    title, status, institution = cache_hits[item_path]
+                    error_message = None
+                    logger.info("文件未发生变化，使用缓存的标题提取结果")
+                elif source_path is None:
+                    # 结果按提交顺序返回，与 pdf_paths 中非重复文件的顺序一致
+                    title, status, institution, error_message, log_records = result = next(results)
+                    if item_path in shared_paths:
+                        shared_results[item_path] = result
+                    
+                    # 输出子进程中产生的日志
+                    for record in log_records:
+                        logger.handle(record)
+                else:
+                    title, status, institution, error_message, _ = shared_results[source_path]
+                    logger.info(f"文件内容与 {source_path} 相同，复用其标题提取结果")
+                
+                # 记录处理开始时间（每个文件只取一次当前时间，后续复用格式化结果）
                 processing_time = datetime.now()
                 timestamp = processing_time.strftime("%Y-%m-%d %H:%M:%S")
+                compact_timestamp = processing_time.strftime("%Y%m%d_%H%M%S")
                 
                 # 初始化文件信息
                 file_info = {
@@ -570,16 +847,26 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
                     'institution': None,
                     'new_filename': item,
                     'author': 'Unknown',
-                    'year': datetime.now().strftime("%Y"),
+                    'year': compact_timestamp[:4],
                     'keywords': 'Untitled',
                     'status': 'skipped',
                     'timestamp': timestamp,
                     'error_message': None
                 }
                 
+                # 子进程提取标题时发生异常
+                if error_message:
+                    logger.error(f"{error_message} - {item_path}")
+                    file_info['status'] = 'processing_error'
+                    file_info['error_message'] = error_message
+                    stats['failed_files'] += 1
+                    excel_data.append(file_info)
+                    continue
+                
+                # 文件处理后所在的路径（重命名成功后更新）
+                final_path = item_path
+                
                 try:
-                    # 提取标题、状态和机构信息
-                    title, status, institution = extract_title(item_path)
                     file_info['extracted_title'] = title
                     file_info['institution'] = institution
                     
@@ -599,7 +886,7 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
                             if custom_unknown_name:
                                 base_name = sanitize_filename(f"{custom_unknown_name}_{timestamp}")
                             else:
-                                base_name = generate_default_filename(processing_time.strftime("%Y%m%d_%H%M%S"))
+                                base_name = generate_default_filename(compact_timestamp)
                             
                             new_filename = base_name + '.pdf'
                             file_info['new_filename'] = new_filename
@@ -608,23 +895,10 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
                             logger.warning(f"无法提取标题，使用默认命名: {new_filename}")
                     else:
                         # 成功提取标题，处理重命名
-                        # 尝试从文件内容提取更多信息
-                        text_content = None
-                        try:
-                            with pdfplumber.open(item_path) as pdf:
-                                # 读取前几页的文本用于提取年份和作者
-                                text_content = ""
-                                for page in pdf.pages[:3]:  # 只读取前3页
-                                    if page.extract_text():
-                                        text_content += page.extract_text()
-                        except:
-                            pass  # 如果读取失败，继续使用已有信息
-                        
                         # 使用新的论文命名函数生成文件名 - 仅包含标题
                         new_filename = generate_paper_filename(
                             original_filename=item,
-                            title=title,
-                            text_content=text_content
+                            title=title
                         )
                         
                         # 从生成的文件名中提取标题信息
@@ -664,6 +938,7 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
                         # 执行重命名
                         try:
                             shutil.move(item_path, new_file_path)
+                            final_path = new_file_path
                             logger.info(f"成功重命名: {item} -> {new_filename}")
                             stats['renamed_files'] += 1
                         except Exception as e:
@@ -680,112 +955,52 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
                     file_info['error_message'] = error_msg
                     stats['failed_files'] += 1
                 
+                # 按处理后的路径记录提取结果（重命名不改变文件大小和修改时间），供下次运行使用
+                if item_path in file_signatures and file_info['status'] != 'processing_error':
+                    size, mtime_ns = file_signatures[item_path]
+                    new_cache[os.path.relpath(final_path, root_folder)] = {
+                        'size': size,
+                        'mtime_ns': mtime_ns,
+                        'title': title,
+                        'status': status,
+                        'institution': institution
+                    }
+                
                 # 添加到Excel数据
                 excel_data.append(file_info)
-        
-        except Exception as e:
-            logger.error(f"处理目录时发生错误 {directory}: {str(e)}")
-            logger.debug(traceback.format_exc())
     
-    # 开始处理
-    logger.info(f"开始处理文件夹: {root_folder}")
-    if recursive:
-        logger.info("将递归处理所有子文件夹")
-    process_directory(root_folder)
+    # 缓存只保留本次处理过的文件
+    if use_cache:
+        save_rename_cache(cache_path, new_cache)
     
     # 生成Excel报告
     excel_file_path = None
     if generate_excel and excel_data:
         try:
-            # 创建DataFrame
-            df = pd.DataFrame(excel_data)
-            
-            # 调整列顺序 - 移除年份相关列，因为文件名现在只包含标题
-            column_order = ['original_filename', 'new_filename', 'original_path', 
-                           'extracted_title', 'title', 
-                           'institution', 'status', 'timestamp', 'error_message']
-            
-            # 确保所有列都存在
-            for col in column_order:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            df = df[column_order]
+            # 列顺序、中文列标题和列宽 - 移除年份相关列，因为文件名现在只包含标题
+            columns = [
+                ('original_filename', '原文件名', 30),
+                ('new_filename', '新文件名', 30),
+                ('original_path', '文件夹路径', 40),
+                ('extracted_title', '提取的标题', 50),
+                ('title', '文件名标题', 45),
+                ('institution', '机构信息', 25),
+                ('status', '状态', 15),
+                ('timestamp', '处理时间', 20),
+                ('error_message', '错误信息', 60)
+            ]
             
             # 生成Excel文件名
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             excel_file_name = f"论文信息汇总_{timestamp}.xlsx"
             excel_file_path = os.path.join(log_dir, excel_file_name)
+            os.makedirs(log_dir, exist_ok=True)
             
-            # 保存Excel文件
-            with pd.ExcelWriter(excel_file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='论文信息汇总')
-                
-                # 格式化工作表
-                worksheet = writer.sheets['论文信息汇总']
-                
-                # 设置列宽 - 移除年份列的设置，因为文件名现在只包含标题
-                column_widths = {
-                    'original_filename': 30,
-                    'new_filename': 30,
-                    'original_path': 40,
-                    'extracted_title': 50,
-                    'title': 45,
-                    'institution': 25,
-                    'status': 15,
-                    'timestamp': 20,
-                    'error_message': 60
-                }
-                
-                # 重命名列标题为中文
-                for cell in worksheet[1]:  # 标题行
-                    column_name = cell.value
-                    if column_name == 'original_filename':
-                        cell.value = '原文件名'
-                    elif column_name == 'new_filename':
-                        cell.value = '新文件名'
-                    elif column_name == 'original_path':
-                        cell.value = '文件夹路径'
-                    elif column_name == 'extracted_title':
-                        cell.value = '提取的标题'
-                    elif column_name == 'title':
-                        cell.value = '文件名标题'
-                    elif column_name == 'institution':
-                        cell.value = '机构信息'
-                    elif column_name == 'status':
-                        cell.value = '状态'
-                    elif column_name == 'timestamp':
-                        cell.value = '处理时间'
-                    elif column_name == 'error_message':
-                        cell.value = '错误信息'
-                    
-                    # 设置标题行字体加粗（使用更通用的方法）
-                    try:
-                        # 尝试导入xlsxwriter并使用正确的方法设置字体
-                        import xlsxwriter
-                        cell.font = xlsxwriter.format.Format({'bold': True})
-                    except:
-                        # 如果失败，继续而不设置字体（保持兼容性）
-                        pass
-                
-                # 设置每列的宽度
-                for column in worksheet.columns:
-                    column_letter = column[0].column_letter
-                    column_name = column[0].value
-                    
-                    if column_name in column_widths:
-                        worksheet.column_dimensions[column_letter].width = column_widths[column_name]
-                    else:
-                        # 自动调整宽度
-                        max_length = 0
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = min(max_length + 2, 50)
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
+            # 保存Excel文件：直接逐行写入，无需先构建DataFrame，缺少的字段留空
+            write_xlsx(excel_file_path, [header for _, header, _ in columns],
+                       ([file_info.get(key) for key, _, _ in columns] for file_info in excel_data),
+                       sheet_name='论文信息汇总',
+                       column_widths=[width for _, _, width in columns])
             
             logger.info(f"Excel报告已生成: {excel_file_path}")
         except Exception as e:
@@ -824,27 +1039,6 @@ def rename_pdfs(root_folder, recursive=True, custom_unknown_name=None, generate_
 
 def main():
     """主函数，处理命令行参数并执行程序"""
-    # 检查必要的依赖库
-    required_libs = {
-        'PyPDF2': 'PyPDF2',
-        'pdfplumber': 'pdfplumber',
-        'pandas': 'pandas',
-        'openpyxl': 'openpyxl'
-    }
-    
-    missing_libs = []
-    for lib_name, install_name in required_libs.items():
-        try:
-            __import__(lib_name)
-        except ImportError:
-            missing_libs.append(install_name)
-    
-    if missing_libs:
-        print(f"错误: 缺少必要的依赖库。")
-        print(f"缺失的库: {', '.join(missing_libs)}")
-        print(f"安装命令: pip install {' '.join(missing_libs)}")
-        return 1
-    
     # 创建命令行参数解析器
     parser = argparse.ArgumentParser(
         description='论文文件规范化命名与信息提取工具',
@@ -865,6 +1059,9 @@ def main():
     parser.add_argument('--no-excel', action='store_true', 
                         help='不生成Excel汇总报告')
     
+    parser.add_argument('--no-cache', action='store_true', 
+                        help='不使用标题提取结果缓存，重新解析全部文件')
+    
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                         default='INFO', help='日志级别（默认: INFO）')
     
@@ -873,6 +1070,9 @@ def main():
     # 解析参数
     args = parser.parse_args()
     
+    # 参数解析成功后再配置日志，--help和参数错误时不会创建日志文件
+    configure_logging(log_file)
+    
     # 如果未提供文件夹路径，则通过输入获取
     folder_path = args.folder_path
     if not folder_path:
@@ -887,6 +1087,7 @@ def main():
         print("  -r, --recursive    递归处理所有子文件夹")
         print("  -n, --custom-name  无法识别标题时使用的自定义命名前缀")
         print("  --no-excel         不生成Excel汇总报告")
+        print("  --no-cache         不使用标题提取结果缓存，重新解析全部文件")
         print("  --log-level        设置日志级别（DEBUG, INFO, WARNING, ERROR）")
         print("\n示例:")
         print("  python pdf_title_renamer.py D:/pdfs -r")
@@ -907,7 +1108,8 @@ def main():
             root_folder=folder_path,
             recursive=args.recursive,
             custom_unknown_name=args.custom_name,
-            generate_excel=not args.no_excel
+            generate_excel=not args.no_excel,
+            use_cache=not args.no_cache
         )
         return 0
     except KeyboardInterrupt:
@@ -922,24 +1124,6 @@ def main():
 
 
 if __name__ == "__main__":
-    # 确保日志目录存在
-    log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-    os.makedirs(log_dir, exist_ok=True)
-    
-    # 配置日志
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"pdf_renamer_{timestamp}.log")
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
-    logger = logging.getLogger()
-    
     # 运行主函数
     exit_code = main()
     exit(exit_code)
\ No newline at end of file
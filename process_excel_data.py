@@ -9,29 +9,91 @@
 """
 
 import os
+import hashlib
+import importlib.util
+import json
 import pandas as pd
 import re
-import json
+from collections import Counter
 from datetime import datetime
 import logging
+from logging_utils import log_dir, configure as configure_logging
+from excel_utils import write_xlsx
+
+try:
+    # 可选依赖：pyahocorasick，用于机构和出版社关键词的单遍匹配
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # 可选依赖：python-calamine，基于Rust的Excel读取引擎，读取速度远快于openpyxl
+    import python_calamine
+except ImportError:
+    python_calamine = None
 
-# 配置日志
-log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-os.makedirs(log_dir, exist_ok=True)
+# pandas 2.2起才支持calamine引擎，更早的版本即使安装了python-calamine也使用默认引擎（openpyxl）
+if python_calamine is not None and tuple(int(part) for part in pd.__version__.split('.')[:2]) < (2, 2):
+    python_calamine = None
 
+try:
+    # 可选依赖：orjson，更快的JSON序列化库
+    import orjson
+except ImportError:
+    orjson = None
+
+# 日志和处理结果都输出到log_dir目录，日志只在命令行入口配置，导入本模块时不会创建日志文件
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 log_file = os.path.join(log_dir, f"excel_processor_{timestamp}.log")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger()
 
+# 文本清理用到的正则和字符表只构建一次
+# 连续空白字符（按Python的\s定义，包括全角空格等Unicode空白）
+_WS_RE = re.compile(r'\s+')
+# 需要直接删除的控制字符，用于str.translate
+# 制表符、换行符、\x0b-\x0d和\x1c-\x1f属于空白字符，不删除，而是与其他空白一起合并为一个空格
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), *range(0x0e, 0x1c)])
+
+# 识别标题列、机构列和出版社列的列名关键词（忽略大小写）
+_TITLE_COL_RE = re.compile(r'title|标题|题目', re.I)
+_INST_COL_RE = re.compile(r'institution|机构|组织', re.I)
+_PUB_COL_RE = re.compile(r'publisher|出版|journal|期刊', re.I)
+
+# 处理结果缓存的版本号，数据清理或匹配逻辑变化导致结果不同时递增，使旧的缓存失效
+_RESULT_CACHE_VERSION = 1
+
+def _build_keyword_automaton(keyword_groups):
+    """构建关键词自动机，未安装pyahocorasick时返回None
+    
+    keyword_groups 为 [(匹配结果, 关键词列表), ...]，载荷为 (优先级, 匹配结果)，优先级沿用列表顺序
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for priority, (value, keywords) in enumerate(keyword_groups):
+        for keyword in keywords:
+            # 重复关键词以先出现的为准
+            if keyword.lower() not in automaton:
+                automaton.add_word(keyword.lower(), (priority, value))
+    automaton.make_automaton()
+    return automaton
+
+def _match_keywords(automaton, keyword_groups_lower, text_lower):
+    """在已转小写的文本中查找关键词，返回优先级最高的匹配结果，没有命中时返回None"""
+    if automaton is not None:
+        # 单遍扫描找出全部命中，取优先级最高的结果
+        hits = [payload for _, payload in automaton.iter(text_lower)]
+        if hits:
+            return min(hits)[1]
+        return None
+    
+    for value, keywords in keyword_groups_lower:
+        if any(keyword in text_lower for keyword in keywords):
+            return value
+    return None
+
 class ExcelProcessor:
     """Excel数据处理类"""
     
@@ -41,6 +103,11 @@ class ExcelProcessor:
         self.output_excel = os.path.join(log_dir, f"processed_papers_{timestamp}.xlsx")
         self.output_json = os.path.join(log_dir, f"processed_papers_{timestamp}.json")
         self.report_file = os.path.join(log_dir, f"processing_report_{timestamp}.txt")
+        os.makedirs(log_dir, exist_ok=True)
+        
+        # 处理结果缓存：输入文件未变化时直接读取上次的处理结果（需要pyarrow）
+        self.use_cache = True
+        self.cache_dir = os.path.join(log_dir, "cache")
         
         # 定义文件夹名称映射（根据现有项目结构）
         self.institution_folders = {
@@ -53,59 +120,103 @@ class ExcelProcessor:
             "知网": ["CNKI", "中国知网", "知网"]
         }
         
+        # 常见出版社列表，简单的出版社提取逻辑，可以根据实际数据调整
+        self.publishers = [
+            "Elsevier", "Springer", "IEEE", "ACM", "AAAI Press", 
+            "Nature Publishing Group", "ScienceDirect", "Taylor & Francis",
+            "Wiley", "Oxford University Press", "Cambridge University Press",
+            "中国知网", "CNKI", "EI", "Engineering Index"
+        ]
+        
+        # 预先转小写的关键词，供未安装pyahocorasick时的逐个匹配使用
+        self._inst_kws_lower = [(folder, tuple(keyword.lower() for keyword in keywords))
+                                for folder, keywords in self.institution_folders.items()]
+        self._pub_kws_lower = [(publisher, (publisher.lower(),)) for publisher in self.publishers]
+        
+        # 机构和出版社关键词自动机，匹配优先级沿用上面定义的顺序
+        self._inst_ac = _build_keyword_automaton(self.institution_folders.items())
+        self._pub_ac = _build_keyword_automaton((publisher, (publisher,)) for publisher in self.publishers)
+        
         # 数据统计信息
         self.stats = {
             "total_rows": 0,
             "processed_rows": 0,
             "invalid_rows": 0,
-            "institution_counts": {},
-            "publisher_counts": {},
+            "institution_counts": Counter(),
+            "publisher_counts": Counter(),
             "errors": []
         }
     
-    def sanitize_text(self, text):
-        """清理和规范化文本数据"""
-        if pd.isna(text):
-            return ""
+    def sanitize_column(self, series):
+        """按列批量清理和规范化文本数据
+        
+        返回清理后的字符串列表，按行位置与原数据对应
+        """
+        # 缺失值转为空字符串，其余值转换为字符串
+        text = series.astype(str).where(series.notna(), '')
         
-        # 转换为字符串并去除前后空格
-        text = str(text).strip()
+        # 去除控制字符、合并多余的空白并去除前后空格
+        # 传入预编译的Python正则，空白字符按Python的\s定义（包括全角空格等Unicode空白）
+        text = text.str.translate(_CTRL_TABLE).str.replace(_WS_RE, ' ', regex=True).str.strip()
         
-        # 处理特殊字符和多余的空白
-        text = re.sub(r'\s+', ' ', text)
-        text = text.replace('\t', ' ').replace('\n', ' ')
+        return text.tolist()
+    
+    def build_row_texts(self, df):
+        """按列批量拼接每一行的全部非空值（以空格分隔），用于缺少机构或出版社列时的关键词匹配
         
-        # 去除控制字符
-        text = ''.join(char for char in text if ord(char) >= 32 or char == '\t' or char == '\n')
+        返回拼接后的字符串列表，按行位置与原数据对应
+        """
+        row_texts = None
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            # 转换为字符串，缺失值保持为NaN，拼接时跳过
+            values = column.astype(str).where(column.notna())
+            if row_texts is None:
+                row_texts = values
+            else:
+                # 两边都有值时以空格连接，否则保留有值的一边
+                row_texts = (row_texts + ' ' + values).fillna(row_texts).fillna(values)
         
-        return text
+        if row_texts is None:
+            return [''] * len(df)
+        return row_texts.fillna('').tolist()
+    
+    def detect_columns(self, columns):
+        """根据列名识别标题列、机构列和出版社列
+        
+        返回(标题列, 机构列, 出版社列)，未识别出的列为None；同类列有多个时取最后一个
+        """
+        # 通常标题列可能包含"title"、"标题"等关键词
+        # 机构和出版社信息可能在其他列中
+        title_column = None
+        institution_column = None
+        publisher_column = None
+        
+        for col in columns:
+            col_name = str(col)
+            if _TITLE_COL_RE.search(col_name):
+                title_column = col
+            elif _INST_COL_RE.search(col_name):
+                institution_column = col
+            elif _PUB_COL_RE.search(col_name):
+                publisher_column = col
+        
+        return title_column, institution_column, publisher_column
     
     def map_institution_to_folder(self, institution_name):
         """将机构名称映射到文件夹名称"""
-        institution_name = institution_name.lower()
-        
-        for folder, keywords in self.institution_folders.items():
-            for keyword in keywords:
-                if keyword.lower() in institution_name:
-                    return folder
+        folder = _match_keywords(self._inst_ac, self._inst_kws_lower, institution_name.lower())
+        if folder:
+            return folder
         
         # 默认返回未知机构
         return "未知机构"
     
     def extract_publisher(self, text):
         """从文本中提取出版社信息"""
-        # 简单的出版社提取逻辑，可以根据实际数据调整
-        publishers = [
-            "Elsevier", "Springer", "IEEE", "ACM", "AAAI Press", 
-            "Nature Publishing Group", "ScienceDirect", "Taylor & Francis",
-            "Wiley", "Oxford University Press", "Cambridge University Press",
-            "中国知网", "CNKI", "EI", "Engineering Index"
-        ]
-        
-        text_lower = text.lower()
-        for publisher in publishers:
-            if publisher.lower() in text_lower:
-                return publisher
+        publisher = _match_keywords(self._pub_ac, self._pub_kws_lower, text.lower())
+        if publisher:
+            return publisher
         
         return "未知出版社"
     
@@ -113,8 +224,20 @@ class ExcelProcessor:
         """加载Excel数据"""
         try:
             logger.info(f"开始加载Excel文件: {self.input_file}")
-            # 使用pandas读取Excel文件
-            df = pd.read_excel(self.input_file)
+            # 使用pandas读取Excel文件，安装了python-calamine时使用calamine引擎，否则使用默认引擎
+            engine = 'calamine' if python_calamine is not None else None
+            with pd.ExcelFile(self.input_file, engine=engine) as excel_file:
+                # 先只读取表头识别需要的列
+                columns = excel_file.parse(nrows=0).columns
+                title_column, institution_column, publisher_column = self.detect_columns(columns)
+                
+                # 标题列和出版社列都能识别时，处理只用到这几列，其余列不必读取；
+                # 否则需要用其他列推测标题或用整行信息匹配出版社，仍读取全部列
+                usecols = None
+                if title_column is not None and publisher_column is not None:
+                    usecols = [position for position, col in enumerate(columns)
+                               if col in (title_column, institution_column, publisher_column)]
+                df = excel_file.parse(usecols=usecols)
             logger.info(f"Excel文件加载成功，共包含 {len(df)} 行数据")
             self.stats["total_rows"] = len(df)
             return df
@@ -130,106 +253,172 @@ class ExcelProcessor:
         
         logger.info("开始处理数据...")
         
-        # 查看前几行数据以了解结构
-        logger.info("\n数据列信息:")
-        for col in df.columns:
-            logger.info(f"- {col}")
-        
-        logger.info("\n前5行数据样本:")
-        logger.info(str(df.head()))
+        # 查看前几行数据以了解结构（未输出INFO日志时不必格式化数据样本）
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n数据列信息:")
+            for col in df.columns:
+                logger.info("- %s", col)
+            
+            logger.info("\n前5行数据样本:")
+            logger.info(str(df.head()))
         
-        # 创建结果DataFrame
-        result_df = pd.DataFrame(columns=["论文所属机构", "细分子机构", "论文标题"])
+        # 结果按列收集到列表中，处理完成后一次性构建DataFrame和统计计数，避免每行都重新分配DataFrame
+        result_folders = []
+        result_publishers = []
+        result_titles = []
         
         # 尝试识别正确的列
-        # 通常标题列可能包含"title"、"标题"等关键词
-        # 机构和出版社信息可能在其他列中
-        title_column = None
-        institution_column = None
-        publisher_column = None
+        title_column, institution_column, publisher_column = self.detect_columns(df.columns)
         
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ["title", "标题", "题目"]):
-                title_column = col
-            elif any(keyword in col_lower for keyword in ["institution", "机构", "组织"]):
-                institution_column = col
-            elif any(keyword in col_lower for keyword in ["publisher", "出版社", "出版", "journal", "期刊"]):
-                publisher_column = col
+        # 识别出的列整体清理一次，循环中按行位置直接取用
+        cleaned_columns = {}
+        if title_column is None:
+            # 如果没有明确的标题列，从其他列中选出清理后文本平均最长的一列作为标题列
+            for col in df.columns:
+                if col not in [institution_column, publisher_column]:
+                    cleaned_columns[col] = self.sanitize_column(df[col])
+            if cleaned_columns:
+                title_column = max(cleaned_columns, key=lambda col: sum(map(len, cleaned_columns[col])))
+                logger.info(f"未找到标题列，按文本平均长度选择标题列: {title_column}")
         
         logger.info(f"\n识别到的列映射:")
         logger.info(f"标题列: {title_column}")
         logger.info(f"机构列: {institution_column}")
         logger.info(f"出版社列: {publisher_column}")
         
+        if title_column in cleaned_columns:
+            titles = cleaned_columns[title_column]
+        else:
+            titles = self.sanitize_column(df[title_column]) if title_column else None
+        institutions = self.sanitize_column(df[institution_column]) if institution_column else None
+        publishers = self.sanitize_column(df[publisher_column]) if publisher_column else None
+        
+        # 没有出版社列时需要用整行信息匹配，整行文本在循环前一次性拼接好
+        row_texts = self.build_row_texts(df) if publishers is None else None
+        
+        # 提取机构信息：优先使用机构列，没有机构列时使用出版社列作为补充，都没有时使用整行信息
+        if institutions is not None:
+            institution_texts = institutions
+        elif publishers is not None:
+            institution_texts = publishers
+        else:
+            institution_texts = row_texts
+        
+        # 表格中同一机构、出版社文本大量重复，只对不同的文本匹配一次，再按行查表
+        folder_map = {text: self.map_institution_to_folder(text) for text in set(institution_texts)}
+        folder_names = [folder_map[text] for text in institution_texts]
+        
+        # 提取出版社信息：没有出版社列时从机构文本或整行信息中提取
+        if publishers is not None:
+            publisher_names = publishers
+        else:
+            publisher_sources = [institution_text or row_text
+                                 for institution_text, row_text in zip(institution_texts, row_texts)]
+            publisher_map = {text: self.extract_publisher(text) for text in set(publisher_sources)}
+            publisher_names = [publisher_map[text] for text in publisher_sources]
+        
         # 处理每一行数据
-        for index, row in df.iterrows():
-            try:
-                # 提取标题
-                title = ""
-                if title_column and title_column in row:
-                    title = self.sanitize_text(row[title_column])
-                else:
-                    # 如果没有明确的标题列，尝试从其他列中提取
-                    for col in df.columns:
-                        if col not in [institution_column, publisher_column]:
-                            potential_title = self.sanitize_text(row[col])
-                            if len(potential_title) > len(title):
-                                title = potential_title
-                
-                # 提取机构信息
-                institution_text = ""
-                if institution_column and institution_column in row:
-                    institution_text = self.sanitize_text(row[institution_column])
-                elif publisher_column and publisher_column in row:
-                    # 如果没有机构列，使用出版社列作为补充
-                    institution_text = self.sanitize_text(row[publisher_column])
-                else:
-                    # 使用整行信息尝试提取
-                    row_text = " ".join([str(val) for val in row.values if pd.notna(val)])
-                    institution_text = row_text
-                
-                # 映射到文件夹名称
-                folder_name = self.map_institution_to_folder(institution_text)
-                
-                # 提取出版社信息
-                publisher_text = ""
-                if publisher_column and publisher_column in row:
-                    publisher_text = self.sanitize_text(row[publisher_column])
-                else:
-                    # 从机构文本或整行信息中提取
-                    if institution_text:
-                        publisher_text = self.extract_publisher(institution_text)
-                    else:
-                        row_text = " ".join([str(val) for val in row.values if pd.notna(val)])
-                        publisher_text = self.extract_publisher(row_text)
-                
-                # 验证数据有效性
-                if not title:
-                    self.stats["invalid_rows"] += 1
-                    self.stats["errors"].append(f"第{index+1}行: 缺少标题信息")
-                    continue
-                
-                # 添加到结果
-                result_df.loc[len(result_df)] = [folder_name, publisher_text, title]
-                
-                # 更新统计信息
-                self.stats["processed_rows"] += 1
-                self.stats["institution_counts"][folder_name] = self.stats["institution_counts"].get(folder_name, 0) + 1
-                self.stats["publisher_counts"][publisher_text] = self.stats["publisher_counts"].get(publisher_text, 0) + 1
-                
-                # 进度提示
-                if (index + 1) % 1000 == 0:
-                    logger.info(f"已处理 {index + 1} 行数据")
-                    
-            except Exception as e:
+        for index in range(len(df)):
+            title = titles[index] if titles is not None else ""
+            
+            # 验证数据有效性
+            if not title:
                 self.stats["invalid_rows"] += 1
-                self.stats["errors"].append(f"第{index+1}行处理失败: {str(e)}")
-                logger.error(f"处理第{index+1}行时出错: {str(e)}")
+                self.stats["errors"].append(f"第{index+1}行: 缺少标题信息")
+                continue
+            
+            # 添加到结果
+            result_folders.append(folder_names[index])
+            result_publishers.append(publisher_names[index])
+            result_titles.append(title)
+            
+            # 进度提示
+            if (index + 1) % 1000 == 0:
+                logger.info("已处理 %d 行数据", index + 1)
+        
+        result_df = pd.DataFrame({
+            "论文所属机构": result_folders,
+            "细分子机构": result_publishers,
+            "论文标题": result_titles
+        })
+        
+        # 更新统计信息
+        self.stats["processed_rows"] += len(result_titles)
+        self.stats["institution_counts"].update(result_folders)
+        self.stats["publisher_counts"].update(result_publishers)
         
         logger.info(f"数据处理完成，成功处理 {self.stats['processed_rows']} 行，无效数据 {self.stats['invalid_rows']} 行")
         return result_df
     
+    def get_cache_paths(self):
+        """返回处理结果缓存文件（Parquet）和统计信息缓存文件（JSON）的路径，输入文件不存在时返回None
+        
+        缓存键由缓存版本号、输入文件的路径、大小、修改时间以及机构和出版社关键词表共同决定，任一变化都会重新处理
+        """
+        try:
+            stat = os.stat(self.input_file)
+        except OSError:
+            return None
+        
+        key_source = json.dumps([_RESULT_CACHE_VERSION, os.path.abspath(self.input_file),
+                                 stat.st_size, stat.st_mtime_ns,
+                                 self.institution_folders, self.publishers], ensure_ascii=False)
+        cache_key = hashlib.sha1(key_source.encode('utf-8')).hexdigest()
+        cache_base = os.path.join(self.cache_dir, cache_key)
+        return cache_base + '.parquet', cache_base + '.json'
+    
+    def load_cached_result(self):
+        """读取缓存的处理结果并恢复统计信息，未命中缓存时返回None"""
+        if not self.use_cache or importlib.util.find_spec('pyarrow') is None:
+            return None
+        
+        cache_paths = self.get_cache_paths()
+        if cache_paths is None:
+            return None
+        parquet_path, stats_path = cache_paths
+        
+        # 统计信息文件在结果文件之后写入，两者都存在时缓存才完整
+        if not (os.path.exists(parquet_path) and os.path.exists(stats_path)):
+            return None
+        
+        try:
+            result_df = pd.read_parquet(parquet_path, engine='pyarrow')
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except Exception as e:
+            logger.warning(f"读取处理结果缓存失败，重新处理数据: {str(e)}")
+            return None
+        
+        stats["institution_counts"] = Counter(stats["institution_counts"])
+        stats["publisher_counts"] = Counter(stats["publisher_counts"])
+        self.stats.update(stats)
+        return result_df
+    
+    def save_cached_result(self, result_df):
+        """将处理结果（Parquet，zstd压缩）和统计信息写入缓存，供输入文件未变化时直接读取"""
+        if not self.use_cache or importlib.util.find_spec('pyarrow') is None:
+            return
+        
+        cache_paths = self.get_cache_paths()
+        if cache_paths is None:
+            return
+        parquet_path, stats_path = cache_paths
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            
+            # 先写入临时文件再替换，避免中断时留下不完整的缓存文件
+            temp_path = parquet_path + '.tmp'
+            result_df.to_parquet(temp_path, engine='pyarrow', compression='zstd', index=False)
+            os.replace(temp_path, parquet_path)
+            
+            temp_path = stats_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, ensure_ascii=False)
+            os.replace(temp_path, stats_path)
+        except Exception as e:
+            logger.warning(f"保存处理结果缓存失败: {str(e)}")
+    
     def save_results(self, result_df):
         """保存处理结果"""
         if result_df is None or result_df.empty:
@@ -238,13 +427,18 @@ class ExcelProcessor:
         
         try:
             # 保存为Excel文件
-            result_df.to_excel(self.output_excel, index=False, engine='openpyxl')
+            write_xlsx(self.output_excel, result_df.columns, result_df.itertuples(index=False, name=None))
             logger.info(f"处理结果已保存到: {self.output_excel}")
             
-            # 保存为JSON文件
-            result_dict = result_df.to_dict(orient='records')
-            with open(self.output_json, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, ensure_ascii=False, indent=2)
+            # 保存为JSON文件：安装了orjson时用orjson序列化后直接写入字节，否则使用标准库json
+            # （两者都不转义中文和"/"，输出与原来一致）
+            result_records = result_df.to_dict(orient='records')
+            if orjson is not None:
+                with open(self.output_json, 'wb') as f:
+                    f.write(orjson.dumps(result_records, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.output_json, 'w', encoding='utf-8') as f:
+                    json.dump(result_records, f, ensure_ascii=False, indent=2)
             logger.info(f"处理结果已保存到: {self.output_json}")
             
             return True
@@ -308,17 +502,24 @@ class ExcelProcessor:
         """运行整个处理流程"""
         logger.info("开始处理论文数据表格...")
         
-        # 步骤1: 加载数据
-        df = self.load_excel_data()
-        if df is None:
-            logger.error("数据加载失败，程序终止")
-            return False
-        
-        # 步骤2: 处理数据
-        result_df = self.process_data(df)
-        if result_df is None or result_df.empty:
-            logger.error("数据处理失败，没有有效数据")
-            return False
+        # 输入文件未变化时直接使用缓存的处理结果，跳过步骤1和步骤2
+        result_df = self.load_cached_result()
+        if result_df is not None:
+            logger.info(f"输入文件未变化，使用缓存的处理结果: {self.input_file}")
+        else:
+            # 步骤1: 加载数据
+            df = self.load_excel_data()
+            if df is None:
+                logger.error("数据加载失败，程序终止")
+                return False
+            
+            # 步骤2: 处理数据
+            result_df = self.process_data(df)
+            if result_df is None or result_df.empty:
+                logger.error("数据处理失败，没有有效数据")
+                return False
+            
+            self.save_cached_result(result_df)
         
         # 步骤3: 保存结果
         if not self.save_results(result_df):
@@ -334,15 +535,20 @@ class ExcelProcessor:
 
 def main():
     """主函数"""
-    # 检查必要的依赖库
-    try:
-        import pandas as pd
-        import openpyxl
-    except ImportError:
+    # 检查必要的依赖库（只查找模块是否存在，不执行模块的导入）
+    # pandas在模块顶部导入，这里只检查写入Excel和读取Excel时才导入的库
+    required_libs = ['xlsxwriter']
+    if python_calamine is None:
+        # 未安装python-calamine时使用openpyxl读取Excel文件
+        required_libs.append('openpyxl')
+    missing_libs = [lib_name for lib_name in required_libs if importlib.util.find_spec(lib_name) is None]
+    if missing_libs:
         print("错误: 缺少必要的依赖库")
-        print("请运行: pip install pandas openpyxl")
+        print(f"请运行: pip install {' '.join(missing_libs)}")
         return 1
     
+    configure_logging(log_file)
+    
     # 创建处理器并运行
     processor = ExcelProcessor()
     success = processor.run()